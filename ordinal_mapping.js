@@ -46,16 +46,67 @@ class FParams {
         this.precomputed[9] = this.precomputed[6] + this.precomputed[7] * this.precomputed[8];
 
         this.precomputed[10] = 1 + 99*this.precomputed[4]/(99+this.scaleTet);
+
+        // Rule 2a table: f(ω^j) = 1 + precomputed[1] * f_finite(j-1, scaleExp)
+        // for small finite j, so the hot branch in f() is a single array read
+        // instead of a BigInt decrement plus a division per call.
+        // Index 0 is unused (ω^0 = 1 is handled through f(1n)).
+        this.fPowOmegaFinite = new Float64Array(FParams.POW_OMEGA_TABLE_SIZE + 1);
+        for (let j = 1; j <= FParams.POW_OMEGA_TABLE_SIZE; j++) {
+            // Same arithmetic as 1 + precomputed[1] * fFinite(BigInt(j-1), scaleExp);
+            // fFinite itself is not callable here (it reads ORDINAL_ZERO, which
+            // is declared after the default FParams instances are built).
+            const n = j - 1;
+            this.fPowOmegaFinite[j] = 1 + this.precomputed[1] * (n === 0 ? 0.0 : n / (n + this.scaleExp));
+        }
     }
 }
 
+// Largest finite exponent j with a precomputed f(ω^j) value.
+FParams.POW_OMEGA_TABLE_SIZE = 32;
+
 // Default parameters for f and fInverse - now an instance of FParams
 const OLD_F_PARAMS = new FParams(1, 1, 1, 1);
 const DEFAULT_F_PARAMS = new FParams(3, 3, 3, 3);
 
-console.log("[Debug] In ordinal_mapping.js, typeof WTowerOrdinal:", typeof WTowerOrdinal, "WTowerOrdinal itself:", WTowerOrdinal);
+console.log("[Debug] In ordinal_mapping.js, typeof WTowerOrdinal:", typeof WTowerOrdinal, "WTowerOrdinal itself:", typeof WTowerOrdinal === 'undefined' ? undefined : WTowerOrdinal);
+
+// Memoized f values, split per parameter set: the outer map is keyed on the
+// scale factors, each inner map on the ordinal key alone. The parameter lookup
+// happens once per f() call, so every per-node probe is a single Map access
+// instead of a concatenated `${ordinalKey}|${paramsKey}` string build.
 const memo = new Map();
 
+// Cap on each per-params table so a long-lived session doesn't retain every
+// value ever computed. Eviction is oldest-first, as in the representation
+// caches below; the limit is far above the working set of any realistic input,
+// so it only kicks in across many evaluations.
+const F_MEMO_LIMIT = 65536;
+
+// Drop all memoized f values (every parameter set). Companion observability
+// helper below reports the current footprint.
+function clearFMemo() {
+    memo.clear();
+}
+
+function fMemoStats() {
+    let entries = 0;
+    for (const table of memo.values()) {
+        entries += table.size;
+    }
+    return { tables: memo.size, entries: entries };
+}
+
+function memoTableForParams(params) {
+    const paramsKey = `params:${params.scaleAdd}-${params.scaleMult}-${params.scaleExp}-${params.scaleTet}`;
+    let table = memo.get(paramsKey);
+    if (table === undefined) {
+        table = new Map();
+        memo.set(paramsKey, table);
+    }
+    return table;
+}
+
 // Ordinal Representation Conventions:
 // - Finite ordinal n: JavaScript BigInt n (e.g., 0n, 1n, 2n, ...)
 // - ω^k: { type: 'pow', k: k_rep } where k_rep is an ordinal representation for k.
@@ -69,6 +120,12 @@ const memo = new Map();
 const ORDINAL_ZERO = 0n;
 const ORDINAL_ONE = 1n;
 
+// Near-zero denominator checks in the hot branches of f(). Per the comments at
+// the check sites, the guarded conditions cannot occur for well-formed
+// representations below ε₀, so the checks are compiled out of the hot path by
+// default; flip to true when debugging suspect input.
+const F_DEBUG_CHECKS = false;
+
 /**
  * Converts an Ordinal class instance (CNFOrdinal, EpsilonNaughtOrdinal, or WTowerOrdinal)
  * to the format expected by the f() function in ordinal_mapping.js.
@@ -106,7 +163,7 @@ function convertOrdinalInstanceToFFormat(ordInstance) {
         const terms = ordInstance.terms;
         if (terms.length === 1 && terms[0].coefficient === 1n && !terms[0].exponent.isZero()) {
             const k_rep_for_f = convertOrdinalInstanceToFFormat(terms[0].exponent);
-            return { type: 'pow', k: k_rep_for_f };
+            return makePow(k_rep_for_f);
         }
         const firstTerm = terms[0];
         const beta_rep_for_f = convertOrdinalInstanceToFFormat(firstTerm.exponent);
@@ -131,7 +188,7 @@ function convertOrdinalInstanceToFFormat(ordInstance) {
             const remainderOrdinal = new CNFOrdinal(remainderTerms, remainderTracer);
             delta_rep_for_f = convertOrdinalInstanceToFFormat(remainderOrdinal);
         }
-        return { type: 'sum', beta: beta_rep_for_f, c: c_num_for_f, delta: delta_rep_for_f };
+        return makeSum(beta_rep_for_f, c_num_for_f, delta_rep_for_f);
     }
 
     console.error("[ConvertInternalFinal] Did not match any known constructor name. ordInstance.constructor.name was:", ordInstance.constructor.name, "Instance:", ordInstance);
@@ -142,6 +199,22 @@ function isFiniteOrdinal(ordinalRep) {
     return typeof ordinalRep === 'bigint';
 }
 
+// fFinite values for small n, built lazily per scale factor (fFinite is called
+// with each of the four scales). Coefficients and finite parts are small in
+// almost all real inputs, so the common case becomes a single array read with
+// no division; the entries come from fFiniteRange, i.e. the same arithmetic.
+const F_FINITE_TABLE_SIZE = 1024;
+const fFiniteTables = new Map();
+
+function fFiniteTableFor(scale) {
+    let table = fFiniteTables.get(scale);
+    if (table === undefined) {
+        table = fFiniteRange(F_FINITE_TABLE_SIZE, scale);
+        fFiniteTables.set(scale, table);
+    }
+    return table;
+}
+
 function fFinite(nBigInt, scale=1) {
     if (typeof nBigInt !== 'bigint' || nBigInt < 0n) {
         throw new Error(`fFinite called with non-BigInt or negative: ${nBigInt}`);
@@ -149,6 +222,9 @@ function fFinite(nBigInt, scale=1) {
     if (nBigInt === ORDINAL_ZERO) {
         return 0.0;
     }
+    if (nBigInt < F_FINITE_TABLE_SIZE) {
+        return fFiniteTableFor(scale)[Number(nBigInt)];
+    }
     // Convert BigInt to Number for floating point division.
     // For very large nBigInt, n/(n+1) approaches 1.
     // Number(nBigInt) might lose precision if nBigInt > Number.MAX_SAFE_INTEGER,
@@ -157,28 +233,151 @@ function fFinite(nBigInt, scale=1) {
     return n_num / (n_num + scale);
 }
 
+// fFinite for an argument already held as a non-negative integer Number
+// (the sum rule's coefficient and the tower height are stored as Numbers).
+// Routing those through fFinite would convert Number -> BigInt -> Number on
+// every node; this path stays on doubles throughout.
+function fFiniteNumber(n, scale=1) {
+    if (n === 0) {
+        return 0.0;
+    }
+    if (n < F_FINITE_TABLE_SIZE) {
+        return fFiniteTableFor(scale)[n];
+    }
+    return n / (n + scale);
+}
+
+// Interned ω^k wrapper objects. The sum branch of f() builds { type: 'pow', k }
+// purely to use it as a memo key, so identical k should reuse a single object;
+// the shared object also keeps its _memoKey cached across all users. Bounded
+// like the other caches so a long-lived session doesn't retain a wrapper (and
+// its k) for every exponent it ever saw; eviction is oldest-first, and an
+// evicted entry — including the pre-seeded small-j ones — is simply
+// re-interned on the next miss.
+const POW_CACHE_LIMIT = 4096;
+const powCache = new Map();
+
+function makePow(kRep) {
+    const kKey = generateOrdinalMemoKey(kRep);
+    let powRep = powCache.get(kKey);
+    if (powRep === undefined) {
+        if (powCache.size >= POW_CACHE_LIMIT) {
+            powCache.delete(powCache.keys().next().value);
+        }
+        powRep = { type: 'pow', k: kRep };
+        powCache.set(kKey, powRep);
+    }
+    return powRep;
+}
+
+// Pre-seed the wrapper cache with ω^j for small finite j; these leaves come up
+// constantly and now always resolve to the same interned object.
+for (let j = 0; j <= FParams.POW_OMEGA_TABLE_SIZE; j++) {
+    makePow(BigInt(j));
+}
+
+// Interned sum representations, bounded so a long-lived session doesn't retain
+// every sum it ever built. Eviction is oldest-first (Maps iterate in insertion
+// order), which is crude but cheap and fine for a working set this size.
+const SUM_CACHE_LIMIT = 4096;
+const sumCache = new Map();
+
+function makeSum(betaRep, cNum, deltaRep) {
+    const key = `${generateOrdinalMemoKey(betaRep)}*${cNum}+${generateOrdinalMemoKey(deltaRep)}`;
+    let sumRep = sumCache.get(key);
+    if (sumRep === undefined) {
+        if (sumCache.size >= SUM_CACHE_LIMIT) {
+            sumCache.delete(sumCache.keys().next().value);
+        }
+        sumRep = { type: 'sum', beta: betaRep, c: cNum, delta: deltaRep };
+        sumCache.set(key, sumRep);
+    }
+    return sumRep;
+}
+
+// Memoized beta+1 representations. Every sum node evaluated by f() asks for
+// beta+1; sums sharing a beta previously rebuilt an identical (and freshly
+// allocated) representation each time. Bounded like the other caches; the
+// working set of distinct betas is tiny next to the limit.
+const ADD_ONE_MEMO_LIMIT = 4096;
+const addOneMemo = new Map();
+
+// Batch evaluation of fFinite over n = 0..count-1 into a typed array. For
+// sweep workloads that probe many small ordinals, one monomorphic Number loop
+// over a Float64Array beats count separate calls with BigInt coercions.
+function fFiniteRange(count, scale=1) {
+    const values = new Float64Array(count); // entry 0 stays 0.0, matching fFinite(0n)
+    for (let n = 1; n < count; n++) {
+        values[n] = n / (n + scale);
+    }
+    return values;
+}
+
+// Same idea for f(ω^j) over finite j = 0..count-1. Entry 0 is f(ω^0) = f(1n);
+// entries j >= 1 use the Rule 2a formula (see fPowOmegaFinite in FParams).
+function fPowOmegaRange(count, params=DEFAULT_F_PARAMS) {
+    const values = new Float64Array(count);
+    if (count > 0) {
+        values[0] = 1 / (1 + params.scaleAdd); // fFinite(1n, scaleAdd)
+    }
+    for (let j = 1; j < count; j++) {
+        const n = j - 1;
+        values[j] = 1 + params.precomputed[1] * (n === 0 ? 0.0 : n / (n + params.scaleExp));
+    }
+    return values;
+}
+
 function addOneToOrdinal(betaOrdRep) {
-    if (isFiniteOrdinal(betaOrdRep)) {
+    if (typeof betaOrdRep === 'bigint') {
         return betaOrdRep + 1n; // BigInt addition
     }
+    const memoKey = generateOrdinalMemoKey(betaOrdRep);
+    let result = addOneMemo.get(memoKey);
+    if (result === undefined) {
+        result = addOneToOrdinalUncached(betaOrdRep);
+        if (addOneMemo.size >= ADD_ONE_MEMO_LIMIT) {
+            addOneMemo.delete(addOneMemo.keys().next().value);
+        }
+        addOneMemo.set(memoKey, result);
+    }
+    return result;
+}
+
+function addOneToOrdinalUncached(betaOrdRep) {
+    // Adding 1 only changes the innermost delta of a nested sum. Rather than
+    // recursing down the chain (one JS frame per level), descend iteratively
+    // collecting the sum nodes, add 1 to the leaf, then rebuild bottom-up.
+    const sumSpine = [];
+    let rep = betaOrdRep;
+    while (typeof rep !== 'bigint' && rep.type === 'sum') {
+        sumSpine.push(rep);
+        rep = rep.delta;
+    }
 
-    const { type, ...args } = betaOrdRep;
-    if (type === 'pow') {
-        const kExpRep = args.k;
+    // rep is now the leaf: a finite BigInt, ω^k, or ω↑↑h.
+    let result;
+    if (typeof rep === 'bigint') {
+        result = rep + 1n; // BigInt addition
+    } else if (rep.type === 'pow') {
+        const kExpRep = rep.k;
         if (kExpRep === ORDINAL_ZERO) { // beta = ω^0 = 1n. So beta+1 = 2n.
-            return 2n;
-        }
-        // General case: ω^k_exp + 1 is represented as ω^k_exp * 1 + 1n
-        return { type: 'sum', beta: kExpRep, c: 1, delta: ORDINAL_ONE }; // c is Number, delta is BigInt
-    } else if (type === 'sum') {
-        const { beta: bExpRep, c: cCoeffInt, delta: dRemRep } = args;
-        return { type: 'sum', beta: bExpRep, c: cCoeffInt, delta: addOneToOrdinal(dRemRep) };
-    } else if (type === 'w_tower') { // NEW CASE
+            result = 2n;
+        } else {
+            // General case: ω^k_exp + 1 is represented as ω^k_exp * 1 + 1n
+            result = makeSum(kExpRep, 1, ORDINAL_ONE); // c is Number, delta is BigInt
+        }
+    } else if (rep.type === 'w_tower') {
         // For beta = ω^^h, beta + 1 is represented as (ω^^h)*1 + 1
-        return { type: 'sum', beta: betaOrdRep, c: 1, delta: ORDINAL_ONE };
+        result = makeSum(rep, 1, ORDINAL_ONE);
     } else {
-        throw new TypeError(`Unknown ordinal object type for addOneToOrdinal: ${type} in ${JSON.stringify(betaOrdRep, bigIntReplacer)}`);
+        throw new TypeError(`Unknown ordinal object type for addOneToOrdinal: ${rep.type} in ${JSON.stringify(rep, bigIntReplacer)}`);
+    }
+
+    while (sumSpine.length > 0) {
+        const sumRep = sumSpine.pop();
+        result = makeSum(sumRep.beta, sumRep.c, result);
     }
+    return result;
 }
 
 // Custom replacer for JSON.stringify to handle BigInt
@@ -193,8 +392,10 @@ function bigIntReplacer(key, value) {
     return value;
 }
 
-// NEW: Custom function to generate a canonical string key for memoization
-function generateOrdinalMemoKey(val) {
+// Key for everything that needs no structural walk: primitives, and objects
+// whose key is already cached. Returns undefined for an object without a
+// cached key — generateOrdinalMemoKey then builds it iteratively.
+function directMemoKey(val) {
     const type = typeof val;
     if (type === 'bigint') return val.toString() + 'n';
     if (val === null) return 'null'; // Important to handle null explicitly
@@ -219,32 +420,321 @@ function generateOrdinalMemoKey(val) {
     if (type === 'number' || type === 'boolean') return String(val);
 
     if (type === 'object') {
-        // Ordinal representations are expected to be plain objects.
-        // No arrays expected directly in the f-format objects themselves (values might be, but handled by recursion).
-        if (Array.isArray(val)) { // Should not be top-level for alphaRep, but robust for general values
-            let arrayResult = '[';
-            for (let i = 0; i < val.length; i++) {
-                arrayResult += generateOrdinalMemoKey(val[i]);
-                if (i < val.length - 1) arrayResult += ',';
+        // Representations are never mutated after construction, so the computed
+        // key is cached on the object itself (non-enumerable, so it stays out of
+        // Object.keys / JSON / spreads). Repeat key generation — every memo
+        // probe on a shared sub-ordinal — becomes O(1) instead of a full walk.
+        return val._memoKey; // undefined until built below
+    }
+    // Should not happen for valid ordinal representations used as keys
+    console.error("[generateOrdinalMemoKey] Unsupported type for memo key generation:", type, val);
+    throw new Error(`Unsupported type for memo key generation: ${type}`);
+}
+
+// NEW: Custom function to generate a canonical string key for memoization
+function generateOrdinalMemoKey(val) {
+    const direct = directMemoKey(val);
+    if (direct !== undefined) {
+        return direct;
+    }
+
+    // Object without a cached key: build keys bottom-up with an explicit
+    // stack. Recursing one frame per nesting level overflowed the call stack
+    // on deeply nested representations even when evaluation itself was
+    // iterative. A node is popped only once every child key is available, so
+    // each assembly step reads finished child keys. Keys for non-extensible
+    // objects (which cannot cache _memoKey) are carried in a side map.
+    const built = new Map();
+    const keyOf = (node) => {
+        const d = directMemoKey(node);
+        return d !== undefined ? d : built.get(node);
+    };
+    // Nodes whose children have been pushed and whose key is still pending.
+    // Needing a second expansion means a child never finished, i.e. the child
+    // is the node itself or an ancestor; bail out rather than loop forever.
+    const expanding = new Set();
+    const stack = [val];
+    while (stack.length > 0) {
+        const node = stack[stack.length - 1];
+        if (keyOf(node) !== undefined) {
+            stack.pop();
+            continue;
+        }
+
+        // Ordinal representations are expected to be plain objects; arrays
+        // should not appear at top level for alphaRep but are handled for
+        // robustness with general values.
+        const isArray = Array.isArray(node);
+        const keys = isArray ? null : Object.keys(node).sort(); // Canonical order is crucial for memo keys
+        const length = isArray ? node.length : keys.length;
+
+        let result = isArray ? '[' : '{';
+        let missingChild = false;
+        for (let i = 0; i < length; i++) {
+            const child = isArray ? node[i] : node[keys[i]];
+            const childKey = keyOf(child);
+            if (childKey === undefined) {
+                stack.push(child);
+                missingChild = true;
+            } else if (!missingChild) {
+                // Keys in our f-format are simple strings, so direct stringification is okay for the key part
+                result += isArray ? childKey : '"' + keys[i] + '":' + childKey;
+                if (i < length - 1) result += ',';
             }
-            arrayResult += ']';
-            return arrayResult;
         }
+        if (missingChild) {
+            if (expanding.has(node)) {
+                throw new RangeError(`Cyclic object graph in generateOrdinalMemoKey`);
+            }
+            expanding.add(node);
+            continue; // children were pushed; assemble this node on revisit
+        }
+        result += isArray ? ']' : '}';
+        if (Object.isExtensible(node)) {
+            Object.defineProperty(node, '_memoKey', { value: result });
+        } else {
+            built.set(node, result);
+        }
+        expanding.delete(node);
+        stack.pop();
+    }
+    return keyOf(val);
+}
 
-        const keys = Object.keys(val).sort(); // Canonical order is crucial for memo keys
-        let objectResult = '{';
-        for (let i = 0; i < keys.length; i++) {
-            const key = keys[i];
-            // Keys in our f-format are simple strings, so direct stringification is okay for the key part
-            objectResult += '"' + key + '":' + generateOrdinalMemoKey(val[key]);
-            if (i < keys.length - 1) objectResult += ',';
+// Per-type handlers for the node loop in f(), selected with a single keyed
+// lookup on the tag instead of branching through the tags in sequence. Each
+// handler returns the node's value, or undefined after pushing missing
+// sub-ordinals onto ctx.todo — in that case the node stays on the stack and is
+// recomputed on a later revisit. ctx carries the per-call state (memo table,
+// work stack, and the hoisted params fields).
+const F_NODE_HANDLERS = {
+    w_tower(rep, ctx) { // New Rule: α is ω↑↑n
+        const height = rep.height;
+        if (typeof height !== 'number' || height < 1 || !Number.isInteger(height)){
+            throw new Error(`Invalid height for w_tower in f(): ${height}`);
+        }
+        return 1+ctx.pre[4]*fFiniteNumber(height-1,ctx.scaleTet);
+    },
+
+    pow(rep, ctx) { // α = ω^k_rep
+        const table = ctx.table;
+        const kRep = rep.k;
+        if (typeof kRep === 'bigint') { // Rule 2a: k_rep is a finite ordinal j (BigInt) >= 0n
+            const jBigInt = kRep;
+            if (jBigInt === ORDINAL_ZERO) { // k_rep is 0n. α = ω^0 = 1n.
+                const oneKey = generateOrdinalMemoKey(ORDINAL_ONE);
+                if (!table.has(oneKey)) {
+                    ctx.todo.push(ORDINAL_ONE);
+                    return undefined;
+                }
+                return table.get(oneKey); // f(1n)
+            }
+            if (jBigInt <= FParams.POW_OMEGA_TABLE_SIZE) { // small finite j: precomputed in FParams
+                return ctx.powOmegaFinite[Number(jBigInt)];
+            }
+            // k_rep is finite j (BigInt) >= 1n. f(ω^j) = 1 + 2f(j-1) = (3j-2)/j.
+            return 1 + ctx.pre[1]*fFinite(jBigInt-1n,ctx.scaleExp);
+        }
+        // Rule 2b: k_rep >= ω (k_rep is an object representation)
+        const kKey = generateOrdinalMemoKey(kRep);
+        if (!table.has(kKey)) {
+            ctx.todo.push(kRep);
+            return undefined;
+        }
+        const fKRep = table.get(kKey);
+        const denominator = ctx.pre[8] - fKRep;
+        if (F_DEBUG_CHECKS && Math.abs(denominator) < 1e-9) {
+            throw new Error(`Division by near-zero in f(ω^k): f(k)=${fKRep} for k=${JSON.stringify(kRep, bigIntReplacer)}`);
+        }
+        return (ctx.pre[6] + fKRep * ctx.pre[7]) / denominator;
+    },
+
+    sum(rep, ctx) { // Rule 3: α = ω^beta_rep * cNum + delta_rep
+        const table = ctx.table;
+        const betaRep = rep.beta;
+        const cNum = rep.c; // cNum is Number(original_BigInt_coeff)
+        const deltaRep = rep.delta;
+
+        // Validate cNum: it should be a positive number (possibly Infinity if original BigInt was huge)
+        // The Ordinal class ensures coefficients are positive BigInts for its terms.
+        // convertOrdinalInstanceToFFormat converts this to Number for cNum.
+        if (typeof cNum !== 'number' || !(Number.isFinite(cNum) || cNum === Infinity) || (cNum <= 0 && cNum !== Infinity) ) {
+             throw new Error(`Mapping 'sum' type received cNum=${cNum}, which is not a positive finite number or positive Infinity as expected from a positive coefficient.`);
+        }
+        if (Number.isFinite(cNum) && cNum < 1) {
+            // This should ideally not happen if the original coefficient was a positive BigInt.
+            // If Number(positive_BigInt) became < 1 (e.g. 0), it's an issue.
+             console.warn(`Mapping 'sum' received cNum=${cNum} < 1. The mapping formula assumes c >= 1 for ω^β*c.`);
+             // For robustness, if it's < 1 but finite, the formula below will use Math.max(0, floor(cNum-1))
         }
-        objectResult += '}';
-        return objectResult;
+
+
+        const termOmegaBeta = makePow(betaRep);
+        const betaPlus1Rep = addOneToOrdinal(betaRep); // betaOrdRep from args
+        const termOmegaBetaPlus1 = makePow(betaPlus1Rep);
+
+        // Push whichever sub-ordinals are still missing, then revisit.
+        const omegaBetaKey = generateOrdinalMemoKey(termOmegaBeta);
+        const omegaBetaPlus1Key = generateOrdinalMemoKey(termOmegaBetaPlus1);
+        let missingSubOrdinal = false;
+        if (!table.has(omegaBetaKey)) {
+            ctx.todo.push(termOmegaBeta);
+            missingSubOrdinal = true;
+        }
+        if (!table.has(omegaBetaPlus1Key)) {
+            ctx.todo.push(termOmegaBetaPlus1);
+            missingSubOrdinal = true;
+        }
+        let deltaKey = null;
+        if (deltaRep !== ORDINAL_ZERO) {
+            deltaKey = generateOrdinalMemoKey(deltaRep);
+            if (!table.has(deltaKey)) {
+                ctx.todo.push(deltaRep);
+                missingSubOrdinal = true;
+            }
+        }
+        if (missingSubOrdinal) {
+            return undefined;
+        }
+
+        const fOmegaBeta = table.get(omegaBetaKey);
+        const fOmegaBetaPlus1 = table.get(omegaBetaPlus1Key);
+
+        let f_c_minus_1_val;
+        let f_c_val;
+
+        if (cNum === Infinity) { // Original BigInt coefficient was too large for Number
+            f_c_minus_1_val = 1.0; // As c -> infinity, f(c-1) -> 1.0
+            f_c_val = 1.0;         // As c -> infinity, f(c) -> 1.0
+        } else {
+            // cNum is finite and positive.
+            // Use Math.floor in case cNum has decimals (though it shouldn't from Number(BigInt)).
+            const cMinus1Num = Math.max(0, Math.floor(cNum - 1.0));
+            const cFloorNum = Math.floor(cNum); // cNum should be >= 1 here based on prior checks for typical cases
+
+            f_c_minus_1_val = fFiniteNumber(cMinus1Num,ctx.scaleMult);
+            f_c_val = fFiniteNumber(cFloorNum,ctx.scaleMult);
+        }
+
+        // The interval width f(ω^(β+1)) - f(ω^β) appears in both the
+        // coefficient and remainder terms; compute it once.
+        const deltaF = fOmegaBetaPlus1 - fOmegaBeta;
+
+        if (deltaRep === ORDINAL_ZERO) { // delta is 0n
+            return fOmegaBeta + deltaF * f_c_minus_1_val;
+        }
+
+        const fDeltaRep = table.get(deltaKey);
+
+        if (F_DEBUG_CHECKS && Math.abs(fOmegaBeta) < 1e-9) { // fOmegaBeta is f(ω^beta)
+            throw new Error(`f(ω^beta_rep) is near-zero (${fOmegaBeta}) for beta_rep=${JSON.stringify(betaRep, bigIntReplacer)}, in denominator. Alpha was ${JSON.stringify(rep, bigIntReplacer)}`);
+        }
+
+        // (fOmegaBetaTimesCPlus1Coeff - fOmegaBetaTimesC) simplifies to
+        // deltaF * (f(c) - f(c-1)), saving the second coefficient
+        // interpolation entirely; distributing deltaF over the combined
+        // bracket then folds the coefficient and remainder terms into one
+        // multiply-add, which also drops one rounding step.
+        return fOmegaBeta + deltaF *
+            (f_c_minus_1_val + (f_c_val - f_c_minus_1_val) * fDeltaRep / fOmegaBeta);
+    },
+};
+
+// Build the per-call context f() and fBatch() hand to the node handlers:
+// the memo table for this parameter set, the shared work stack, and the
+// params fields hoisted into own properties — property walks like
+// params.precomputed[...] would otherwise repeat on every node visit.
+function makeFContext(params, todo) {
+    const table = memoTableForParams(params);
+    // Trim the memo to its cap only between drains. Evicting mid-drain can
+    // drop a value a node still on the todo stack is waiting to read, and
+    // the recomputation then evicts its siblings in turn — a livelock once a
+    // single evaluation touches more distinct sub-ordinals than the cap. A
+    // single drain may overshoot F_MEMO_LIMIT; the overshoot is trimmed
+    // (oldest-first, Maps iterate in insertion order) on the next call.
+    while (table.size > F_MEMO_LIMIT) {
+        table.delete(table.keys().next().value);
+    }
+    return {
+        table,
+        todo,
+        pre: params.precomputed,
+        powOmegaFinite: params.fPowOmegaFinite,
+        scaleAdd: params.scaleAdd,
+        scaleMult: params.scaleMult,
+        scaleExp: params.scaleExp,
+        scaleTet: params.scaleTet,
+    };
+}
+
+// Iterative post-order evaluation. Recursing on sub-ordinals overflows the
+// JS call stack for deeply nested representations (e.g. tall ω^ω^... towers),
+// so instead we keep an explicit stack of representations still to evaluate.
+// When a node's sub-ordinals are not all in the memo yet, they are pushed and
+// the node stays on the stack; it is computed on a later revisit, once every
+// value it needs can be read straight out of the memo. Drains ctx.todo
+// completely, leaving every visited node's value in the memo table. Input
+// depth is bounded by heap, not call-stack, size only because
+// generateOrdinalMemoKey builds keys iteratively as well — keep it that way.
+function drainFStack(ctx) {
+    const table = ctx.table;
+    const todo = ctx.todo;
+    const pre = ctx.pre;
+    const scaleAdd = ctx.scaleAdd;
+
+    // Keys of nodes whose sub-ordinals have been pushed and whose values are
+    // still outstanding. Between expanding a node and revisiting it, every
+    // sub-ordinal it pushed sits above it on the stack and must have been
+    // memoized for it to be revisited — unless one of them needs this node's
+    // own value (e.g. a sum whose β is ω↑↑h: its ω^(β+1) term contains the
+    // sum itself). Recursion threw RangeError on such input; a handler coming
+    // up short on a second expansion is the explicit-stack equivalent, so
+    // refuse it the same way instead of re-pushing forever.
+    const expanded = new Set();
+
+    while (todo.length > 0) {
+        const rep = todo[todo.length - 1];
+
+        if (rep !== "E0_TYPE" && typeof rep !== 'bigint' && (typeof rep !== 'object' || rep === null || !rep.type)) {
+            throw new TypeError(`Invalid ordinal representation type: ${typeof rep} for ${rep === null ? 'null' : (typeof rep === 'object' ? JSON.stringify(rep, bigIntReplacer) : rep )}`);
+        }
+
+        const memoKey = generateOrdinalMemoKey(rep);
+
+        if (table.has(memoKey)) {
+            todo.pop();
+            continue;
+        }
+
+        let result;
+
+        if (rep === "E0_TYPE") { // ε₀ appearing as a sub-ordinal
+            result = pre[5];
+        } else if (typeof rep === 'bigint') { // Rule 1: α is finite n (BigInt)
+            result = fFinite(rep, scaleAdd);
+        } else {
+            // One keyed lookup picks the handler for this node type. (The
+            // string tags are a cross-file contract shared with
+            // ordinal_mapping_inverse.js and the converters, so dispatch stays
+            // keyed on them.)
+            const handler = F_NODE_HANDLERS[rep.type];
+            if (handler === undefined) {
+                throw new TypeError(`Unknown ordinal object type in f: ${rep.type}`);
+            }
+            result = handler(rep, ctx);
+            if (result === undefined) {
+                if (expanded.has(memoKey)) {
+                    throw new RangeError(`Cyclic ordinal representation in f(): ${memoKey} depends on its own value`);
+                }
+                expanded.add(memoKey);
+                continue; // missing sub-ordinals were pushed; compute on revisit
+            }
+            expanded.delete(memoKey);
+        }
+
+        table.set(memoKey, result);
+        todo.pop();
     }
-    // Should not happen for valid ordinal representations used as keys
-    console.error("[generateOrdinalMemoKey] Unsupported type for memo key generation:", type, val);
-    throw new Error(`Unsupported type for memo key generation: ${type}`);
 }
 
 function f(alphaRep, params=DEFAULT_F_PARAMS) {
@@ -258,115 +748,113 @@ function f(alphaRep, params=DEFAULT_F_PARAMS) {
         throw new TypeError(`Invalid ordinal representation type: ${typeof alphaRep} for ${alphaRep === null ? 'null' : (typeof alphaRep === 'object' ? JSON.stringify(alphaRep, bigIntReplacer) : alphaRep )}`);
     }
 
-    // Use the new custom key generation function
-    const ordinalKeyPart = generateOrdinalMemoKey(alphaRep);
-    
-    // Create a stable string representation of the relevant parts of the params object
-    const paramsKeyPart = `params:${params.scaleAdd}-${params.scaleMult}-${params.scaleExp}-${params.scaleTet}`;
-    
-    const memoKey = `${ordinalKeyPart}|${paramsKeyPart}`;
+    const ctx = makeFContext(params, [alphaRep]);
+    const table = ctx.table;
 
-    if (memo.has(memoKey)) {
-        return memo.get(memoKey);
-    }
+    const rootKey = generateOrdinalMemoKey(alphaRep);
 
-    let result = 0.0;
+    if (table.has(rootKey)) {
+        return table.get(rootKey);
+    }
 
-    if (isFiniteOrdinal(alphaRep)) { // Rule 1: α is finite n (BigInt)
-        result = fFinite(alphaRep, params.scaleAdd);
-    } else {
-        const { type, ...args } = alphaRep;
+    drainFStack(ctx);
 
-        if (type === 'w_tower') { // New Rule: α is ω↑↑n
-            const height = args.height;
-            if (typeof height !== 'number' || height < 1 || !Number.isInteger(height)){
-                throw new Error(`Invalid height for w_tower in f(): ${height}`);
-            }
-            result = 1+params.precomputed[4]*fFinite(BigInt(height-1),params.scaleTet);
-        } else if (type === 'pow') { // α = ω^k_rep
-            const kRep = args.k;
-            if (isFiniteOrdinal(kRep)) { // Rule 2a: k_rep is a finite ordinal j (BigInt) >= 0n
-                const jBigInt = kRep;
-                if (jBigInt === ORDINAL_ZERO) { // k_rep is 0n. α = ω^0 = 1n.
-                    result = f(ORDINAL_ONE, params); // f(1n)
-                } else { // k_rep is finite j (BigInt) >= 1n. f(ω^j) = 1 + 2f(j-1) = (3j-2)/j.
-                    const j_num = Number(jBigInt); // Convert BigInt to Number for formula
-                    result = 1 + params.precomputed[1]*fFinite(jBigInt-1n,params.scaleExp);
-                }
-            } else { // Rule 2b: k_rep >= ω (k_rep is an object representation)
-                const fKRep = f(kRep, params);
-                const denominator = params.precomputed[8] - fKRep;
-                if (Math.abs(denominator) < 1e-9) {
-                    throw new Error(`Division by near-zero in f(ω^k): f(k)=${fKRep} for k=${JSON.stringify(kRep, bigIntReplacer)}`);
-                }
-                result = (params.precomputed[6] + fKRep * params.precomputed[7]) / denominator;
-            }
-        } else if (type === 'sum') { // Rule 3: α = ω^beta_rep * cNum + delta_rep
-            const { beta: betaRep, c: cNum, delta: deltaRep } = args; // cNum is Number(original_BigInt_coeff)
-
-            // Validate cNum: it should be a positive number (possibly Infinity if original BigInt was huge)
-            // The Ordinal class ensures coefficients are positive BigInts for its terms.
-            // convertOrdinalInstanceToFFormat converts this to Number for cNum.
-            if (typeof cNum !== 'number' || !(Number.isFinite(cNum) || cNum === Infinity) || (cNum <= 0 && cNum !== Infinity) ) {
-                 throw new Error(`Mapping 'sum' type received cNum=${cNum}, which is not a positive finite number or positive Infinity as expected from a positive coefficient.`);
-            }
-            if (Number.isFinite(cNum) && cNum < 1) {
-                // This should ideally not happen if the original coefficient was a positive BigInt.
-                // If Number(positive_BigInt) became < 1 (e.g. 0), it's an issue.
-                 console.warn(`Mapping 'sum' received cNum=${cNum} < 1. The mapping formula assumes c >= 1 for ω^β*c.`);
-                 // For robustness, if it's < 1 but finite, the formula below will use Math.max(0, floor(cNum-1))
-            }
+    return table.get(rootKey);
+}
 
+// Evaluate f over a whole batch of ordinals in one pass, returning a
+// Float64Array aligned with alphaReps. Per-ordinal f() calls would drain a
+// fresh stack each time; when the batch shares structure (e.g. successive
+// CNFs while enumerating ordinals), seeding one stack with every root and
+// draining it once computes each distinct sub-ordinal a single time across
+// the batch, with the rest of the results read straight out of the memo.
+function fBatch(alphaReps, params=DEFAULT_F_PARAMS) {
+    const results = new Float64Array(alphaReps.length);
+    const ctx = makeFContext(params, []);
+    const table = ctx.table;
+    const rootKeys = new Array(alphaReps.length);
+
+    for (let i = 0; i < alphaReps.length; i++) {
+        const rep = alphaReps[i];
+        if (rep === "E0_TYPE") {
+            rootKeys[i] = null; // filled in directly, nothing to evaluate
+            results[i] = params.precomputed[5];
+            continue;
+        }
+        if (typeof rep !== 'bigint' && (typeof rep !== 'object' || rep === null || !rep.type)) {
+            throw new TypeError(`Invalid ordinal representation type: ${typeof rep} for ${rep === null ? 'null' : (typeof rep === 'object' ? JSON.stringify(rep, bigIntReplacer) : rep )}`);
+        }
+        const key = generateOrdinalMemoKey(rep);
+        rootKeys[i] = key;
+        if (!table.has(key)) {
+            ctx.todo.push(rep);
+        }
+    }
 
-            const termOmegaBeta = { type: 'pow', k: betaRep };
-            const betaPlus1Rep = addOneToOrdinal(betaRep); // betaOrdRep from args
-            const termOmegaBetaPlus1 = { type: 'pow', k: betaPlus1Rep };
+    drainFStack(ctx);
 
-            const fOmegaBeta = f(termOmegaBeta, params);
-            const fOmegaBetaPlus1 = f(termOmegaBetaPlus1, params);
+    for (let i = 0; i < alphaReps.length; i++) {
+        const key = rootKeys[i];
+        if (key === null) {
+            continue;
+        }
+        if (table.has(key)) {
+            results[i] = table.get(key);
+        } else {
+            // The drain memoizes every root and nothing evicts mid-batch;
+            // recompute defensively rather than silently report 0.0.
+            results[i] = f(alphaReps[i], params);
+        }
+    }
 
-            let f_c_minus_1_val;
-            let f_c_val;
+    return results;
+}
 
-            if (cNum === Infinity) { // Original BigInt coefficient was too large for Number
-                f_c_minus_1_val = 1.0; // As c -> infinity, f(c-1) -> 1.0
-                f_c_val = 1.0;         // As c -> infinity, f(c) -> 1.0
-            } else {
-                // cNum is finite and positive.
-                // Convert to BigInt for fFinite. Use Math.floor in case cNum has decimals (though it shouldn't from Number(BigInt)).
-                const cMinus1BigInt = BigInt(Math.max(0, Math.floor(cNum - 1.0)));
-                const cBigInt = BigInt(Math.floor(cNum)); // cNum should be >= 1 here based on prior checks for typical cases
+// f(ω^k) as a standalone entry point. Callers previously built a throwaway
+// { type: 'pow', k } wrapper per call just to hand it to f(); going through
+// makePow reuses one interned wrapper (and its cached memo key) per distinct k.
+function fPow(kRep, params=DEFAULT_F_PARAMS) {
+    return f(makePow(kRep), params);
+}
 
-                f_c_minus_1_val = fFinite(cMinus1BigInt,params.scaleMult);
-                f_c_val = fFinite(cBigInt,params.scaleMult);
+// Warm the memo for alphaRep and everything f() will need for it: collect the
+// distinct sub-ordinals (including the ω^β and ω^(β+1) wrappers the sum rule
+// uses) with an iterative walk, then evaluate them smallest-first so each f()
+// call resolves against an already-populated memo. Useful before evaluating a
+// batch of ordinals that share structure.
+function precomputeF(alphaRep, params=DEFAULT_F_PARAMS) {
+    const seen = new Set();
+    const order = []; // pre-order; reversed below for bottom-up evaluation
+    const stack = [alphaRep];
+    while (stack.length > 0) {
+        const rep = stack.pop();
+        if (typeof rep === 'object' && rep !== null) {
+            const key = generateOrdinalMemoKey(rep);
+            if (seen.has(key)) {
+                continue;
             }
-            
-            const fOmegaBetaTimesC = fOmegaBeta +
-                (fOmegaBetaPlus1 - fOmegaBeta) * f_c_minus_1_val;
-
-            if (deltaRep === ORDINAL_ZERO) { // delta is 0n
-                result = fOmegaBetaTimesC;
-            } else { 
-                const fOmegaBetaTimesCPlus1Coeff = fOmegaBeta +
-                    (fOmegaBetaPlus1 - fOmegaBeta) * f_c_val;
-
-                const fDeltaRep = f(deltaRep, params);
-
-                if (Math.abs(fOmegaBeta) < 1e-9) { // fOmegaBeta is f(ω^beta)
-                    throw new Error(`f(ω^beta_rep) is near-zero (${fOmegaBeta}) for beta_rep=${JSON.stringify(betaRep, bigIntReplacer)}, in denominator. Alpha was ${JSON.stringify(alphaRep, bigIntReplacer)}`);
+            seen.add(key);
+            if (rep.type === 'pow' && typeof rep.k !== 'bigint') {
+                stack.push(rep.k);
+            } else if (rep.type === 'sum') {
+                stack.push(makePow(rep.beta));
+                stack.push(makePow(addOneToOrdinal(rep.beta)));
+                if (rep.delta !== ORDINAL_ZERO) {
+                    stack.push(rep.delta);
                 }
-
-                result = fOmegaBetaTimesC +
-                    (fOmegaBetaTimesCPlus1Coeff - fOmegaBetaTimesC) *
-                    fDeltaRep / fOmegaBeta;
             }
-        } else {
-            throw new TypeError(`Unknown ordinal object type in f: ${type}`);
         }
+        order.push(rep);
     }
+    for (let i = order.length - 1; i >= 0; i--) {
+        f(order[i], params);
+    }
+}
 
-    memo.set(memoKey, result);
-    return result;
+// Evaluate f(alphaRep) through the precompute pass above.
+function fEval(alphaRep, params=DEFAULT_F_PARAMS) {
+    precomputeF(alphaRep, params);
+    return f(alphaRep, params);
 }
 
 // To use this in a browser or Node.js, you might export it:
@@ -418,7 +906,53 @@ if (typeof require !== 'undefined' && require.main === module) { // Basic check
     console.log(`f(ω^2*2) = ${f(omegaSqTimes2Rep, testParams)}`); 
 
     const omegaSqPlusOmegaRep = { type: 'sum', beta: 2n, c: 1, delta: omegaRep };
-    console.log(`f(ω^2+ω) = ${f(omegaSqPlusOmegaRep, testParams)}`); 
+    console.log(`f(ω^2+ω) = ${f(omegaSqPlusOmegaRep, testParams)}`);
+
+    // The batch/precompute entry points and typed-array helpers must agree
+    // with plain f() exactly; they share the same rules and memo.
+    console.log("Checking fPow/fBatch/fEval agreement with f()...");
+    let mismatches = 0;
+    const check = (name, actual, expected) => {
+        if (actual !== expected) {
+            mismatches++;
+            console.log(`  MISMATCH ${name}: ${actual} !== ${expected}`);
+        }
+    };
+
+    const agreementReps = [
+        ORDINAL_ZERO, 7n, "E0_TYPE", omegaRep, omegaOmegaOmegaRep,
+        omegaTimes2Plus1Rep, omegaSqPlusOmegaRep,
+        { type: 'sum', beta: omegaRep, c: 3, delta: omegaTimes2Rep },
+        { type: 'w_tower', height: 4 },
+    ];
+
+    clearFMemo();
+    const batchValues = fBatch(agreementReps, testParams);
+    for (let i = 0; i < agreementReps.length; i++) {
+        check(`fBatch[${i}]`, batchValues[i], f(agreementReps[i], testParams));
+    }
+    clearFMemo();
+    for (let i = 0; i < agreementReps.length; i++) {
+        check(`fEval[${i}]`, fEval(agreementReps[i], testParams), f(agreementReps[i], testParams));
+    }
+    check('fPow(2n)', fPow(2n, testParams), f(omegaSqRep, testParams));
+    check('fPow(ω)', fPow(omegaRep, testParams), f(omegaOmegaRep, testParams));
+
+    const finiteValues = fFiniteRange(16, testParams.scaleAdd);
+    for (let n = 0; n < 16; n++) {
+        check(`fFiniteRange[${n}]`, finiteValues[n], f(BigInt(n), testParams));
+    }
+    const powOmegaValues = fPowOmegaRange(16, testParams);
+    for (let j = 0; j < 16; j++) {
+        check(`fPowOmegaRange[${j}]`, powOmegaValues[j], fPow(BigInt(j), testParams));
+    }
+
+    clearFMemo();
+    check('clearFMemo empties the memo', fMemoStats().entries, 0);
+    f(omegaOmegaRep, testParams);
+    check('fMemoStats counts entries', fMemoStats().entries > 0, true);
+
+    console.log(mismatches === 0 ? "All agreement checks passed." : `${mismatches} agreement check(s) FAILED.`);
 
     console.log("Test cases finished.");
 }
\ No newline at end of file
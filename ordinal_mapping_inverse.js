@@ -35,8 +35,8 @@ function findFiniteOrdinal(x, threshold, scale=1) {
 }
 
 function findCoefficientHigher(x, k, params, threshold) {
-    const fOmegaK = f({ type: 'pow', k: k }, params);
-    const fOmegaKPlus1 = f({ type: 'pow', k: addOneToOrdinal(k) }, params);
+    const fOmegaK = fPow(k, params);
+    const fOmegaKPlus1 = fPow(addOneToOrdinal(k), params);
 
     const target_f_m_minus_1 = (x - fOmegaK)/(fOmegaKPlus1 - fOmegaK);
 
@@ -71,8 +71,8 @@ function findCoefficientHigher(x, k, params, threshold) {
 }
 
 function findRemainderHigher(x, k, m, params, threshold) {
-    const fOmegaK = f({ type: 'pow', k: k }, params);
-    const fOmegaKPlus1 = f({ type: 'pow', k: addOneToOrdinal(k) }, params);
+    const fOmegaK = fPow(k, params);
+    const fOmegaKPlus1 = fPow(addOneToOrdinal(k), params);
     const fOmegaKM = fOmegaK + (fOmegaKPlus1 - fOmegaK) * fFinite(BigInt(Math.max(0, m-1)),params.scaleMult);
     const fOmegaKMPlus1 = fOmegaK + (fOmegaKPlus1 - fOmegaK) * fFinite(BigInt(m),params.scaleMult);
     